@@ -1,14 +1,17 @@
 import asyncio
 import base64
-import json
+import functools
+import hmac
 import os
 import re
 import secrets
 import signal
+import sys
 import time
 from collections import deque
 from pathlib import Path
 
+import orjson
 from starlette.applications import Starlette
 from starlette.authentication import (
     AuthCredentials,
@@ -19,15 +22,20 @@ from starlette.authentication import (
 from starlette.middleware import Middleware
 from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, PlainTextResponse
-from starlette.routing import Route
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Mount, Route
 from starlette.templating import Jinja2Templates
 
 from nanobot.config import loader as config_loader
 from nanobot.config.schema import Config
 
-ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
-SECRET_FIELDS = {"api_key", "apiKey", "token", "app_secret", "appSecret", "encrypt_key", "encryptKey", "verification_token", "verificationToken"}
+ANSI_CSI = b"\x1b["
+ANSI_PARAM_BYTES = frozenset(b"0123456789;")
+READ_CHUNK_SIZE = 65536
+LOG_BUFFER_SIZE = 500
+# Matched by key name anywhere in the config (dicts and lists alike), so
+# masking on GET and restoring on PUT always cover the same keys.
+SECRET_FIELDS = frozenset(map(sys.intern, ("api_key", "apiKey", "token", "app_secret", "appSecret", "encrypt_key", "encryptKey", "verification_token", "verificationToken")))
 
 templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
 
@@ -38,6 +46,8 @@ if not ADMIN_PASSWORD:
     ADMIN_PASSWORD = secrets.token_urlsafe(16)
     print(f"Generated admin password: {ADMIN_PASSWORD}")
 
+_EXPECTED_AUTH = b"Basic " + base64.b64encode(f"{ADMIN_USERNAME}:{ADMIN_PASSWORD}".encode())
+
 
 try:
     load_config = config_loader.load_config
@@ -50,13 +60,20 @@ if _nanobot_convert_keys is None:
     _nanobot_convert_keys = getattr(config_loader, "convert_to_snake", None)
 
 _nanobot_convert_to_camel = getattr(config_loader, "convert_to_camel", None)
+_nanobot_get_config_path = getattr(config_loader, "get_config_path", None)
+
+
+_SNAKE_RE1 = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_SNAKE_RE2 = re.compile(r"([a-z0-9])([A-Z])")
 
 
+@functools.lru_cache(maxsize=2048)
 def _to_snake_case(value: str) -> str:
-    step1 = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", value)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", step1).lower()
+    step1 = _SNAKE_RE1.sub(r"\1_\2", value)
+    return _SNAKE_RE2.sub(r"\1_\2", step1).lower()
 
 
+@functools.lru_cache(maxsize=2048)
 def _to_camel_case(value: str) -> str:
     parts = value.split("_")
     if not parts:
@@ -93,6 +110,10 @@ class BasicAuthBackend(AuthenticationBackend):
             return None
 
         auth = conn.headers["Authorization"]
+        # Dashboards resend the same header on every poll; match it whole first.
+        if hmac.compare_digest(auth.encode("latin-1"), _EXPECTED_AUTH):
+            return AuthCredentials(["authenticated"]), SimpleUser(ADMIN_USERNAME)
+
         try:
             scheme, credentials = auth.split()
             if scheme.lower() != "basic":
@@ -102,31 +123,89 @@ class BasicAuthBackend(AuthenticationBackend):
             raise AuthenticationError("Invalid credentials")
 
         username, _, password = decoded.partition(":")
-        if username == ADMIN_USERNAME and password == ADMIN_PASSWORD:
+        username_ok = hmac.compare_digest(username.encode(), ADMIN_USERNAME.encode())
+        password_ok = hmac.compare_digest(password.encode(), ADMIN_PASSWORD.encode())
+        if username_ok and password_ok:
             return AuthCredentials(["authenticated"]), SimpleUser(username)
 
         raise AuthenticationError("Invalid credentials")
 
 
+class ORJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Pre-encoded bodies for responses whose content never (or rarely) changes.
+_OK_BYTES = b'{"ok":true}'
+_HEALTH_BYTES: dict[str, bytes] = {}
+_UNAUTHORIZED_HEADERS = {"WWW-Authenticate": 'Basic realm="nanobot"'}
+
+
 def require_auth(request: Request):
     if not request.user.is_authenticated:
         return PlainTextResponse(
             "Unauthorized",
             status_code=401,
-            headers={"WWW-Authenticate": 'Basic realm="nanobot"'},
+            headers=_UNAUTHORIZED_HEADERS,
         )
     return None
 
 
+def _strip_ansi_bytes(line: bytes) -> bytes:
+    """Remove SGR escapes (ESC [ <digits/;> m) from a raw output line."""
+    start = line.find(ANSI_CSI)
+    if start == -1:
+        return line
+    out = bytearray()
+    pos = 0
+    size = len(line)
+    while start != -1:
+        end = start + 2
+        while end < size and line[end] in ANSI_PARAM_BYTES:
+            end += 1
+        if end < size and line[end] == 0x6D:  # "m"
+            out += line[pos:start]
+            pos = end + 1
+            start = line.find(ANSI_CSI, pos)
+        else:
+            # Not an SGR sequence; leave it in place and keep scanning.
+            start = line.find(ANSI_CSI, start + 1)
+    out += line[pos:]
+    return bytes(out)
+
+
 class GatewayManager:
     def __init__(self):
         self.process: asyncio.subprocess.Process | None = None
         self.state = "stopped"
-        self.logs: deque[str] = deque(maxlen=500)
+        # Fixed-size ring of log lines, each stored pre-encoded as a JSON
+        # string so /api/logs only has to join them.
+        self._log_ring: list[bytes] = [b""] * LOG_BUFFER_SIZE
+        self._log_idx = 0
+        self._log_count = 0
         self.start_time: float | None = None
         self.restart_count = 0
         self._read_tasks: list[asyncio.Task] = []
 
+    def add_logs(self, lines):
+        ring = self._log_ring
+        idx = self._log_idx
+        added = 0
+        for line in lines:
+            ring[idx] = orjson.dumps(line)
+            idx = (idx + 1) % LOG_BUFFER_SIZE
+            added += 1
+        self._log_idx = idx
+        self._log_count = min(self._log_count + added, LOG_BUFFER_SIZE)
+
+    def logs_json(self) -> bytes:
+        if self._log_count < LOG_BUFFER_SIZE:
+            lines = self._log_ring[:self._log_idx]
+        else:
+            lines = self._log_ring[self._log_idx:] + self._log_ring[:self._log_idx]
+        return b'{"lines":[' + b",".join(lines) + b"]}"
+
     async def start(self):
         if self.process and self.process.returncode is None:
             return
@@ -143,7 +222,7 @@ class GatewayManager:
             self._read_tasks.append(task)
         except Exception as e:
             self.state = "error"
-            self.logs.append(f"Failed to start gateway: {e}")
+            self.add_logs([f"Failed to start gateway: {e}"])
 
     async def stop(self):
         if not self.process or self.process.returncode is not None:
@@ -164,20 +243,36 @@ class GatewayManager:
         self.restart_count += 1
         await self.start()
 
+    @staticmethod
+    def _clean_line(line: bytes) -> str:
+        return _strip_ansi_bytes(line).decode("utf-8", errors="replace").rstrip()
+
     async def _read_output(self):
+        # Read in large chunks and split lines here so a burst of output is
+        # handled in one wakeup instead of one readline() per line.
+        buffer = bytearray()
         try:
             while self.process and self.process.stdout:
-                line = await self.process.stdout.readline()
-                if not line:
+                chunk = await self.process.stdout.read(READ_CHUNK_SIZE)
+                if not chunk:
                     break
-                decoded = line.decode("utf-8", errors="replace").rstrip()
-                cleaned = ANSI_ESCAPE.sub("", decoded)
-                self.logs.append(cleaned)
+                buffer += chunk
+                end = buffer.rfind(b"\n")
+                if end == -1:
+                    if len(buffer) < READ_CHUNK_SIZE:
+                        continue
+                    # No newline in a full chunk; flush it rather than grow forever.
+                    end = len(buffer)
+                lines = bytes(buffer[:end]).split(b"\n")
+                del buffer[:end + 1]
+                self.add_logs(map(self._clean_line, lines))
         except asyncio.CancelledError:
             return
+        if buffer:
+            self.add_logs([self._clean_line(bytes(buffer))])
         if self.process and self.process.returncode is not None and self.state == "running":
             self.state = "error"
-            self.logs.append(f"Gateway exited with code {self.process.returncode}")
+            self.add_logs([f"Gateway exited with code {self.process.returncode}"])
 
     def get_status(self) -> dict:
         pid = None
@@ -197,49 +292,198 @@ class GatewayManager:
 gateway = GatewayManager()
 config_lock = asyncio.Lock()
 
+# Published snapshot of the config: the Config object plus its dumped and
+# camelCase forms. Readers take the current dict without locking; writers
+# build a complete replacement and swap it in with one assignment. The
+# config file's (mtime, size) is kept so edits made outside the dashboard
+# are still picked up.
+_config_cache: dict = {}
 
-def mask_secrets(data, _path=""):
-    if isinstance(data, dict):
-        result = {}
-        for k, v in data.items():
-            if k in SECRET_FIELDS and isinstance(v, str) and v:
-                result[k] = v[:8] + "***" if len(v) > 8 else "***"
-            else:
-                result[k] = mask_secrets(v, f"{_path}.{k}")
-        return result
-    if isinstance(data, list):
-        return [mask_secrets(item, _path) for item in data]
-    return data
 
+def _config_file_key():
+    if _nanobot_get_config_path is None:
+        return None
+    try:
+        st = _nanobot_get_config_path().stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
-def _collect_secret_values(data, field_name):
-    values = []
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if k == field_name and isinstance(v, str):
-                values.append(v)
+
+def _publish_config(config, key) -> dict:
+    global _config_cache
+    dumped = config.model_dump()
+    entry = {"key": key, "cfg": config, "dumped": dumped, "camel": convert_to_camel(dumped)}
+    _config_cache = entry
+    return entry
+
+
+def _load_config_entry(key) -> dict:
+    # Runs in a worker thread.
+    return _publish_config(load_config(), key)
+
+
+def _save_and_publish_config(config) -> dict:
+    # Runs in a worker thread while config_lock is held.
+    save_config(config)
+    return _publish_config(config, _config_file_key())
+
+
+async def _get_config_entry() -> dict:
+    key = _config_file_key()
+    entry = _config_cache
+    if not entry or entry["key"] != key:
+        entry = await asyncio.to_thread(_load_config_entry, key)
+    return entry
+
+
+async def _get_cached_config():
+    entry = await _get_config_entry()
+    return entry["cfg"], entry["dumped"], entry["camel"]
+
+
+async def _get_config_summary():
+    entry = await _get_config_entry()
+    if "providers_summary" not in entry:
+        data = entry["dumped"]
+        entry["providers_summary"] = {
+            name: {"configured": bool(prov.get("api_key"))}
+            for name, prov in data["providers"].items()
+        }
+        entry["channels_summary"] = {
+            name: {"enabled": chan.get("enabled", False)}
+            for name, chan in data["channels"].items()
+        }
+    return entry["providers_summary"], entry["channels_summary"]
+
+
+def _mask_value(v: str) -> str:
+    return v[:8] + "***" if len(v) > 8 else "***"
+
+
+def mask_secrets(data):
+    if not isinstance(data, (dict, list)):
+        return data
+
+    # Walk with an explicit stack; each entry pairs a source container with
+    # the (already attached) output container it should be copied into.
+    root = {} if isinstance(data, dict) else [None] * len(data)
+    stack = deque([(data, root)])
+    while stack:
+        src, out = stack.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
+        for k, v in items:
+            if isinstance(v, dict):
+                child = out[k] = {}
+                stack.append((v, child))
+            elif isinstance(v, list):
+                child = out[k] = [None] * len(v)
+                stack.append((v, child))
+            elif k in SECRET_FIELDS and isinstance(v, str) and v:
+                out[k] = _mask_value(v)
             else:
-                values.extend(_collect_secret_values(v, field_name))
-    elif isinstance(data, list):
-        for item in data:
-            values.extend(_collect_secret_values(item, field_name))
+                out[k] = v
+    return root
+
+
+def _collect_all_secret_values(data, fields=SECRET_FIELDS):
+    values: dict[str, list[str]] = {}
+    stack = [data] if isinstance(data, (dict, list)) else []
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for k, v in items:
+            if k in fields and isinstance(v, str):
+                values.setdefault(k, []).append(v)
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
     return values
 
 
-def merge_secrets(new_data, existing_data):
-    if isinstance(new_data, dict) and isinstance(existing_data, dict):
-        result = {}
-        for k, v in new_data.items():
-            # Preserve existing secret only when UI sends a masked placeholder.
-            # Empty string means user intentionally cleared the value.
-            if k in SECRET_FIELDS and isinstance(v, str) and v.endswith("***"):
-                result[k] = existing_data.get(k, "")
-            else:
-                result[k] = merge_secrets(v, existing_data.get(k, {}))
-        return result
+def _redact_secrets(message: str, data) -> str:
+    values = {
+        val
+        for vals in _collect_all_secret_values(data).values()
+        for val in vals
+        if len(val) > 3
+    }
+    if not values:
+        return message
+    # Longest first so a secret that contains another is redacted whole.
+    pattern = re.compile("|".join(map(re.escape, sorted(values, key=len, reverse=True))))
+    return pattern.sub("***", message)
+
+
+def _get_existing_secrets(data) -> dict[tuple, str]:
+    """Secret values in a camelCase config dump, keyed by their key path.
+
+    Walks by key name rather than schema so extra-field channels, custom
+    providers and untyped dicts are covered exactly as mask_secrets sees them.
+    """
+    secrets_map = {}
+    stack = [((), data)] if isinstance(data, (dict, list)) else []
+    while stack:
+        path, node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for k, v in items:
+            if k in SECRET_FIELDS and isinstance(v, str):
+                secrets_map[path + (k,)] = v
+            elif isinstance(v, (dict, list)):
+                stack.append((path + (k,), v))
+    return secrets_map
+
+
+def merge_secrets(new_data, existing_secrets):
+    # Preserve existing secret only when UI sends a masked placeholder.
+    # Empty string means user intentionally cleared the value.
+    # Matches by key name like mask_secrets; new_data is updated in place.
+    stack = [((), new_data)] if isinstance(new_data, (dict, list)) else []
+    while stack:
+        path, node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for k, v in items:
+            if k in SECRET_FIELDS and isinstance(v, str):
+                if v.endswith("***"):
+                    node[k] = existing_secrets.get(path + (k,), "")
+            elif isinstance(v, (dict, list)):
+                stack.append((path + (k,), v))
     return new_data
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_cron_files(files: tuple) -> list:
+    jobs = []
+    for path, _, _ in files:
+        try:
+            with open(path, "rb") as f:
+                jobs.append(orjson.loads(f.read()))
+        except Exception:
+            pass
+    return jobs
+
+
+def _read_cron_jobs(cron_dir: Path) -> list:
+    # Runs in a worker thread so disk reads and parsing stay off the event loop.
+    # Files are only re-parsed when a name, mtime or size changes; the directory
+    # mtime alone would miss jobs rewritten in place.
+    files = []
+    try:
+        with os.scandir(cron_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.path, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return []
+    return _parse_cron_files(tuple(files))
+
+
 async def homepage(request: Request):
     auth_err = require_auth(request)
     if auth_err:
@@ -248,16 +492,18 @@ async def homepage(request: Request):
 
 
 async def health(request: Request):
-    return JSONResponse({"status": "ok", "gateway": gateway.state})
+    body = _HEALTH_BYTES.get(gateway.state)
+    if body is None:
+        body = _HEALTH_BYTES[gateway.state] = orjson.dumps({"status": "ok", "gateway": gateway.state})
+    return Response(body, media_type="application/json")
 
 
 async def api_config_get(request: Request):
     auth_err = require_auth(request)
     if auth_err:
         return auth_err
-    config = load_config()
-    data = convert_to_camel(config.model_dump())
-    return JSONResponse(mask_secrets(data))
+    _, _, data = await _get_cached_config()
+    return ORJSONResponse(mask_secrets(data))
 
 
 async def api_config_put(request: Request):
@@ -266,39 +512,40 @@ async def api_config_put(request: Request):
         return auth_err
 
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
     except Exception:
-        return JSONResponse({"error": "Invalid JSON"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid JSON"}, status_code=400)
 
     try:
         restart = body.pop("_restartGateway", False)
 
         async with config_lock:
-            existing_config = load_config()
-            existing_data = convert_to_camel(existing_config.model_dump())
+            _, _, existing_data = await _get_cached_config()
 
-            merged = merge_secrets(body, existing_data)
+            merged = merge_secrets(body, _get_existing_secrets(existing_data))
             snake_data = convert_keys(merged)
 
             try:
-                new_config = Config.model_validate(snake_data)
+                new_config = await asyncio.to_thread(Config.model_validate, snake_data)
             except Exception as e:
-                err_msg = str(e)
-                for field in SECRET_FIELDS:
-                    for val in _collect_secret_values(snake_data, field):
-                        if val and len(val) > 3:
-                            err_msg = err_msg.replace(val, "***")
-                return JSONResponse({"error": f"Validation error: {err_msg}"}, status_code=400)
+                err_msg = _redact_secrets(str(e), snake_data)
+                return ORJSONResponse({"error": f"Validation error: {err_msg}"}, status_code=400)
 
-            save_config(new_config)
+            await asyncio.to_thread(_save_and_publish_config, new_config)
 
         if restart:
             asyncio.create_task(gateway.restart())
 
-        return JSONResponse({"ok": True, "restarting": restart})
+        return ORJSONResponse({"ok": True, "restarting": restart})
     except Exception as e:
         print(f"Config save error: {type(e).__name__}: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
+
+
+async def api_config(request: Request):
+    if request.method == "PUT":
+        return await api_config_put(request)
+    return await api_config_get(request)
 
 
 async def api_status(request: Request):
@@ -306,27 +553,12 @@ async def api_status(request: Request):
     if auth_err:
         return auth_err
 
-    config = load_config()
-    data = config.model_dump()
-
-    providers = {}
-    for name, prov in data["providers"].items():
-        providers[name] = {"configured": bool(prov.get("api_key"))}
-
-    channels = {}
-    for name, chan in data["channels"].items():
-        channels[name] = {"enabled": chan.get("enabled", False)}
+    providers, channels = await _get_config_summary()
 
     cron_dir = Path.home() / ".nanobot" / "cron"
-    cron_jobs = []
-    if cron_dir.exists():
-        for f in cron_dir.glob("*.json"):
-            try:
-                cron_jobs.append(json.loads(f.read_text()))
-            except Exception:
-                pass
+    cron_jobs = await asyncio.to_thread(_read_cron_jobs, cron_dir)
 
-    return JSONResponse({
+    return ORJSONResponse({
         "gateway": gateway.get_status(),
         "providers": providers,
         "channels": channels,
@@ -338,7 +570,7 @@ async def api_logs(request: Request):
     auth_err = require_auth(request)
     if auth_err:
         return auth_err
-    return JSONResponse({"lines": list(gateway.logs)})
+    return Response(gateway.logs_json(), media_type="application/json")
 
 
 async def api_gateway_start(request: Request):
@@ -346,7 +578,7 @@ async def api_gateway_start(request: Request):
     if auth_err:
         return auth_err
     asyncio.create_task(gateway.start())
-    return JSONResponse({"ok": True})
+    return Response(_OK_BYTES, media_type="application/json")
 
 
 async def api_gateway_stop(request: Request):
@@ -354,7 +586,7 @@ async def api_gateway_stop(request: Request):
     if auth_err:
         return auth_err
     asyncio.create_task(gateway.stop())
-    return JSONResponse({"ok": True})
+    return Response(_OK_BYTES, media_type="application/json")
 
 
 async def api_gateway_restart(request: Request):
@@ -362,11 +594,11 @@ async def api_gateway_restart(request: Request):
     if auth_err:
         return auth_err
     asyncio.create_task(gateway.restart())
-    return JSONResponse({"ok": True})
+    return Response(_OK_BYTES, media_type="application/json")
 
 
 async def auto_start_gateway():
-    config = load_config()
+    config, _, _ = await _get_cached_config()
     if config.get_api_key():
         asyncio.create_task(gateway.start())
 
@@ -374,13 +606,14 @@ async def auto_start_gateway():
 routes = [
     Route("/", homepage),
     Route("/health", health),
-    Route("/api/config", api_config_get, methods=["GET"]),
-    Route("/api/config", api_config_put, methods=["PUT"]),
-    Route("/api/status", api_status),
-    Route("/api/logs", api_logs),
-    Route("/api/gateway/start", api_gateway_start, methods=["POST"]),
-    Route("/api/gateway/stop", api_gateway_stop, methods=["POST"]),
-    Route("/api/gateway/restart", api_gateway_restart, methods=["POST"]),
+    Mount("/api", routes=[
+        Route("/config", api_config, methods=["GET", "PUT"]),
+        Route("/status", api_status),
+        Route("/logs", api_logs),
+        Route("/gateway/start", api_gateway_start, methods=["POST"]),
+        Route("/gateway/stop", api_gateway_stop, methods=["POST"]),
+        Route("/gateway/restart", api_gateway_restart, methods=["POST"]),
+    ]),
 ]
 
 app = Starlette(
@@ -402,11 +635,20 @@ if __name__ == "__main__":
     config = uvicorn.Config(app, host="0.0.0.0", port=port, log_level="info", loop="asyncio")
     server = uvicorn.Server(config)
 
-    def handle_signal():
-        loop.create_task(gateway.stop())
+    stop_event = asyncio.Event()
+
+    async def supervise():
+        # Stop the gateway fully before asking uvicorn to exit so the
+        # nanobot subprocess is never left running behind us.
+        await stop_event.wait()
+        await gateway.stop()
         server.should_exit = True
 
     for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, handle_signal)
+        loop.add_signal_handler(sig, stop_event.set)
 
+    supervisor = loop.create_task(supervise())
     loop.run_until_complete(server.serve())
+    supervisor.cancel()
+    loop.run_until_complete(asyncio.gather(supervisor, return_exceptions=True))
+    loop.close()